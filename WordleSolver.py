@@ -1,165 +1,527 @@
 # Import required libraries
-import math  # For entropy calculations
-from collections import defaultdict  # For efficient counting
-from tqdm import tqdm  # For progress bars
+from concurrent.futures import ProcessPoolExecutor  # For parallel candidate scoring
+import hashlib  # For keying cached results by word list contents
+import os  # For the on-disk cache directory
+import time  # For timing the guess search
+import numpy as np  # For vectorized pattern and entropy calculations
+
+try:
+    from numba import njit, prange  # Optional JIT compilation of the entropy kernel
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def best_entropy(PAT, candidates, possible, table):
+        # Entropy of each candidate against the possible answers, in parallel over candidates
+        # Pattern lookup, bucket counting and the entropy sum are fused in one pass, so no
+        # per-answer pattern array is ever materialized
+        out = np.empty(len(candidates))
+        for k in prange(len(candidates)):
+            row = PAT[candidates[k]]
+            counts = np.zeros(243, dtype=np.int32)
+            for j in possible:
+                counts[row[j]] += 1
+            
+            entropy = 0.0
+            for c in counts:
+                entropy += table[c]
+            out[k] = entropy
+        return out
+
+try:
+    import cupy as cp  # Optional GPU scoring while many answers remain
+    cp.cuda.runtime.getDeviceCount()
+except (ImportError, RuntimeError):
+    cp = None
+
+if cp is not None:
+    # One block per (candidate, 256 answers): patterns are counted in a shared-memory
+    # histogram, then merged into that candidate's row of the global (M, 243) counts
+    PATTERN_HISTOGRAM = cp.RawKernel(r'''
+    extern "C" __global__
+    void pattern_histogram(const unsigned char* allowed, const unsigned char* possibles,
+                           int n, int* counts) {
+        __shared__ int hist[243];
+        for (int k = threadIdx.x; k < 243; k += blockDim.x) hist[k] = 0;
+        __syncthreads();
+
+        int i = blockIdx.x;
+        int j = blockIdx.y * blockDim.x + threadIdx.x;
+        if (j < n) {
+            const unsigned char* g = allowed + i * 5;
+            const unsigned char* t = possibles + j * 5;
+            int green = 0;
+            for (int k = 0; k < 5; k++) {
+                if (g[k] == t[k]) green |= 1 << k;
+            }
+            int used = green;
+            int pid = 0;
+            for (int k = 0; k < 5; k++) {
+                int code = 0;
+                if (green >> k & 1) {
+                    code = 2;
+                } else {
+                    for (int m = 0; m < 5; m++) {
+                        if (!(used >> m & 1) && t[m] == g[k]) {
+                            used |= 1 << m;
+                            code = 1;
+                            break;
+                        }
+                    }
+                }
+                pid = pid * 3 + code;
+            }
+            atomicAdd(&hist[pid], 1);
+        }
+        __syncthreads();
+
+        for (int k = threadIdx.x; k < 243; k += blockDim.x) {
+            if (hist[k]) atomicAdd(&counts[i * 243 + k], hist[k]);
+        }
+    }
+    ''', 'pattern_histogram')
+
+# Use the GPU only while more answers than this remain; later turns stay on the CPU
+GPU_MIN_POSSIBLE = 1000
+
+# Directory for results cached across runs
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'wordle')
+
+# Base-3 digit for each feedback color in a pattern id
+PATTERN_CODES = {'A': 0, 'P': 1, 'C': 2}
+
+# Version of the pattern id encoding; bump it to invalidate cached pattern tables
+PATTERN_FORMAT = 1
+
+# Tolerance added to entropy upper bounds so float32 table rounding (under 1e-6 bits
+# with float64 accumulation) never prunes the best candidate
+BOUND_SLACK = 1e-5
+
+# Scores this close are ties, resolved in favor of the earlier candidate on every path
+TIE_TOLERANCE = 1e-9
+
+def entropy_table(total):
+    # Entropy term -(c/N) * log2(c/N) for every bucket size c in 0..N (zero for empty buckets)
+    # float32 entries are ample for ranking guesses; sums are accumulated in float64
+    p = np.arange(1, total + 1) / total
+    table = np.zeros(total + 1, dtype=np.float32)
+    table[1:] = -p * np.log2(p)
+    return table
+
+def pattern_entropy(pattern_ids, table):
+    # Shannon entropy of the distribution of pattern ids, using a table from entropy_table
+    return float(table.take(np.bincount(pattern_ids, minlength=243)).sum(dtype=np.float64))
+
+def beats(score, i, best_score, best_index):
+    # Higher entropy wins; scores within TIE_TOLERANCE tie and go to the earlier candidate
+    if score > best_score + TIE_TOLERANCE:
+        return True
+    return score >= best_score - TIE_TOLERANCE and i < best_index
+
+# Pattern table as seen by a worker process, set up by init_worker
+WORKER_PAT = None
+
+def init_worker(pat_path, shape, PAT=None):
+    # Worker: map the cached pattern table read-only (shared page cache), or keep the given copy
+    global WORKER_PAT
+    WORKER_PAT = np.memmap(pat_path, dtype=np.uint8, mode='r', shape=shape) if pat_path else PAT
+
+def score_candidates(possible, indices, bounds, table):
+    # Worker: best (index, score, candidates evaluated) among candidates ordered by decreasing bound
+    best_index, best_score, evaluated = None, -float('inf'), 0
+    for i, bound in zip(indices, bounds):
+        if bound < best_score - TIE_TOLERANCE:
+            break
+        score = pattern_entropy(WORKER_PAT[i, possible], table)
+        evaluated += 1
+        if beats(score, i, best_score, best_index):
+            best_index, best_score = int(i), score
+    return best_index, best_score, evaluated
 
 class WordleSolver:
-    _pattern_cache = {}  # Class-level cache for pattern calculation results
+    # Fixed attribute layout: word data, pattern table, caches, workers and game state
+    __slots__ = (
+        'answers', 'allowed', 'answer_bytes', 'answer_codes', 'word_bits', 'word_pos_bits',
+        'candidates', 'candidate_index', 'candidate_codes', 'PAT', 'gpu_candidates', 'gpu_answers',
+        'cache_key', 'opener_path', 'opener', 'pat_path', 'workers', 'pool',
+        'possible_idx', 'required_mask', 'absent_mask', 'correct_bytes', 'pos_forbidden'
+    )
     
-    def __init__(self, answer_path, guess_path=None):
-        # Initialize with answer words and allowed guesses
-        self.answers = self.load_valid_words(answer_path)
-        self.allowed = self.load_valid_words(guess_path) if guess_path else self.answers.copy()
+    def __init__(self, answer_path, guess_path=None, workers=None):
+        # Initialize with answer words and allowed guesses as (N, 5) uint8 letter matrices
+        answer_bytes = self.load_valid_words(answer_path)
+        allowed_bytes = self.load_valid_words(guess_path) if guess_path else answer_bytes
+        
+        # Keep plain strings for display and guess lookup
+        self.answers = self.decode_words(answer_bytes)
+        self.allowed = self.decode_words(allowed_bytes)
         
         # Print loading statistics
         print(f"Loaded {len(self.answers)} answer words")
         print(f"Loaded {len(self.allowed)} allowed guesses")
         
-        # Initialize game state
-        self.state = {
-            'possible': self.answers.copy(),  # Remaining possible solutions
-            'correct': ['?'] * 5,  # Known correct letters/positions
-            'present': set(),  # Letters that exist in word but position unknown
-            'absent': set()  # Letters confirmed not in word
-        }
+        # Keep answers as ASCII letters and as an (N, 5) matrix of letter codes 0-25
+        self.answer_bytes = answer_bytes
+        self.answer_codes = answer_bytes - 65
+        
+        # Use first 2315 words (standard Wordle answer list size) as guess candidates
+        self.candidates = self.allowed[:2315]
+        self.candidate_index = {word: i for i, word in enumerate(self.candidates)}
+        self.candidate_codes = allowed_bytes[:2315] - 65
+        
+        # Cache files are keyed by the contents of the answer and candidate lists
+        self.cache_key = (f"{hashlib.md5(answer_bytes.tobytes()).hexdigest()}_"
+                          f"{hashlib.md5(allowed_bytes[:2315].tobytes()).hexdigest()}")
+        self.opener_path = os.path.join(CACHE_DIR, f"opener_{self.cache_key}")
+        self.opener = self.load_opener()
+        
+        # Feedback pattern of every candidate against every answer, memory-mapped from the cache
+        self.pat_path = os.path.join(CACHE_DIR, f"pat_v{PATTERN_FORMAT}_{self.cache_key}.u8")
+        self.PAT = self.load_pattern_table()
+        
+        # Keep encoded words on the GPU when CuPy is available
+        self.gpu_candidates = cp.asarray(self.candidate_codes) if cp is not None else None
+        self.gpu_answers = cp.asarray(self.answer_codes) if cp is not None else None
+        
+        # Optionally score candidates across worker processes; with the table cached on
+        # disk each worker maps the same file instead of holding its own copy
+        # Workers only serve the NumPy branch-and-bound path, which Numba replaces
+        self.workers = workers
+        self.pool = None
+        if workers and workers > 1 and njit is not None:
+            print(f"Numba kernel is parallel already; ignoring workers={workers}")
+        elif workers and workers > 1:
+            if isinstance(self.PAT, np.memmap):
+                initargs = (self.pat_path, self.PAT.shape)
+            else:
+                initargs = (None, self.PAT.shape, self.PAT)
+            self.pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=initargs)
+        
+        # Precompute letter bitmasks for every answer word: one bit per letter at each
+        # position, and their union as the word's letter-presence mask
+        self.word_pos_bits = np.left_shift(np.uint32(1), self.answer_codes, dtype=np.uint32)
+        self.word_bits = np.bitwise_or.reduce(self.word_pos_bits, axis=1)
+        
+        self.reset_state()
+
+    def reset_state(self):
+        # Initialize game state (letters encoded as bits 0-25 for A-Z)
+        self.possible_idx = np.arange(len(self.answers), dtype=np.int32)  # Indices of remaining possible solutions
+        self.required_mask = 0  # Letters that must appear in the word
+        self.absent_mask = 0  # Letters confirmed not in word
+        self.correct_bytes = bytearray(b'?????')  # Known correct letters/positions as ASCII bytes
+        self.pos_forbidden = [0] * 5  # Letters ruled out at each position
 
     def load_valid_words(self, file_path):
-        # Load and validate 5-letter words from file
+        # Load and validate 5-letter words from file into an (N, 5) uint8 matrix of ASCII letters
         try:
-            with open(file_path, 'r') as f:
-                # Read and sanitize words
-                words = [word.strip().upper() for word in f if len(word.strip()) == 5]
+            with open(file_path, 'rb') as f:
+                # Read the whole file at once and keep uppercase 5-letter words
+                words = [word for word in f.read().upper().split() if len(word) == 5 and word.isalpha()]
                 if not words:
                     raise ValueError(f"No valid 5-letter words found in '{file_path}'!")
-                return words
+                return np.frombuffer(b''.join(words), dtype=np.uint8).reshape(-1, 5)
         except FileNotFoundError:
             raise FileNotFoundError(f"File '{file_path}' not found!")
 
+    @staticmethod
+    def decode_words(word_bytes):
+        # Convert a uint8 letter matrix back into a list of strings
+        text = word_bytes.tobytes().decode('ascii')
+        return [text[i:i + 5] for i in range(0, len(text), 5)]
+
     @staticmethod
     def get_pattern(guess, target):
-        # Calculate Wordle feedback pattern (C=Correct, P=Present, A=Absent)
-        pattern = [''] * 5
-        counts = defaultdict(int)
+        # Calculate Wordle feedback pattern as a base-3 id (A=0, P=1, C=2)
+        # Words are uppercase ASCII bytes so letters index a flat 26-slot counter
+        if isinstance(guess, str):
+            guess = guess.encode('ascii')
+        if isinstance(target, str):
+            target = target.encode('ascii')
+        counts = [0] * 26
         
-        # First pass: Mark correct letters
-        for i, (g, t) in enumerate(zip(guess, target)):
-            if g == t:
-                pattern[i] = 'C'
-                counts[t] += 1
+        # First pass: Count target letters not matched by a correct letter
+        for g, t in zip(guess, target):
+            if g != t:
+                counts[t - 65] += 1
         
-        # Second pass: Handle present/absent letters
-        for i, g in enumerate(guess):
-            if pattern[i] == 'C':
-                continue
-            
-            # Calculate available slots for present letters
-            total_in_target = sum(1 for t in target if t == g)
-            if total_in_target > counts[g]:
-                pattern[i] = 'P'
-                counts[g] += 1
+        # Second pass: Handle present/absent letters while building the id
+        pid = 0
+        for g, t in zip(guess, target):
+            if g == t:
+                code = 2
+            elif counts[g - 65]:
+                # Consume one remaining slot for this present letter
+                code = 1
+                counts[g - 65] -= 1
             else:
-                pattern[i] = 'A'
+                code = 0
+            pid = pid * 3 + code
+        
+        return pid
+
+    @staticmethod
+    def get_patterns(guess, targets):
+        # Vectorized feedback of one encoded guess against every row of targets
+        # Patterns are base-3 integers (A=0, P=1, C=2), first letter most significant
+        n = len(targets)
+        rows = np.arange(n)
+        greens = targets == guess
         
-        return tuple(pattern)
+        # Count each target's letters not already matched by a green
+        counts = np.zeros((n, 26), dtype=np.int8)
+        for i in range(5):
+            counts[rows, targets[:, i]] += ~greens[:, i]
+        
+        # Mark present letters left to right, consuming the remaining counts
+        keys = np.zeros(n, dtype=np.uint8)
+        for i in range(5):
+            g = guess[i]
+            yellow = ~greens[:, i] & (counts[:, g] > 0)
+            counts[yellow, g] -= 1
+            keys = keys * 3 + np.where(greens[:, i], 2, yellow).astype(np.uint8)
+        
+        return keys
 
     @staticmethod
-    def get_pattern_cached(guess, target):
-        # Memoized version of get_pattern for performance
-        key = (guess, target)
-        if key not in WordleSolver._pattern_cache:
-            WordleSolver._pattern_cache[key] = WordleSolver.get_pattern(guess, target)
-        return WordleSolver._pattern_cache[key]
-
-    def calculate_entropy(self, word):
-        # Calculate information entropy for a potential guess
-        pattern_counts = defaultdict(int)
-        # Count patterns for all possible answers
-        for possible in self.state['possible']:
-            pattern = self.get_pattern_cached(word, possible)
-            pattern_counts[pattern] += 1
-        
-        # Calculate entropy using Shannon's formula
-        total = len(self.state['possible'])
-        entropy = sum(-(count/total) * math.log2(count/total) 
-                      for count in pattern_counts.values())
-        return entropy
+    def pattern_id(colors):
+        # Encode a C/P/A feedback sequence as a base-3 pattern id
+        pid = 0
+        for c in colors:
+            pid = pid * 3 + PATTERN_CODES[c]
+        return pid
+
+    def calculate_entropy(self, i, table=None):
+        # Calculate information entropy for candidate i from the precomputed table
+        # Pass an entropy_table for the current number of possible answers to reuse it
+        possible = self.possible_idx
+        if table is None:
+            table = entropy_table(len(possible))
+        return pattern_entropy(self.PAT[i, possible], table)
+
+    def gpu_entropies(self, table):
+        # Entropy of every candidate computed on the GPU, returned as a NumPy array
+        possible = self.gpu_answers[cp.asarray(self.possible_idx)]
+        n = len(possible)
+        m = len(self.candidates)
+        
+        counts = cp.zeros((m, 243), dtype=cp.int32)
+        PATTERN_HISTOGRAM((m, (n + 255) // 256), (256,), (self.gpu_candidates, possible, np.int32(n), counts))
+        
+        entropies = cp.asarray(table).take(counts).sum(axis=1, dtype=cp.float64)
+        return cp.asnumpy(entropies)
+
+    @staticmethod
+    def binary_entropy(p):
+        # Entropy in bits of a yes/no outcome with probability p
+        p = np.clip(p, 1e-12, 1 - 1e-12)
+        return -(p * np.log2(p) + (1 - p) * np.log2(1 - p))
+
+    def entropy_upper_bounds(self):
+        # Cheap upper bound on every candidate's entropy, used to prune the full scan
+        # A pattern's entropy is at most the sum of its five per-letter entropies, and
+        # each letter is green with known probability, else yellow at most as often
+        # as targets contain that letter somewhere other than this position
+        possible = self.possible_idx
+        total = len(possible)
+        targets = self.answer_codes[possible]
+        
+        # Letter counts per position and number of targets containing each letter
+        pos_counts = np.stack([np.bincount(targets[:, k], minlength=26) for k in range(5)])
+        present = np.zeros((total, 26), dtype=bool)
+        present[np.arange(total)[:, None], targets] = True
+        letter_counts = present.sum(axis=0)
+        
+        positions = np.arange(5)
+        codes = self.candidate_codes
+        p_green = pos_counts[positions, codes] / total
+        p_yellow = (letter_counts[codes] - pos_counts[positions, codes]) / total
+        rest = 1 - p_green
+        split = np.minimum(p_yellow / np.maximum(rest, 1e-12), 0.5)
+        
+        bounds = (self.binary_entropy(p_green) + rest * self.binary_entropy(split)).sum(axis=1)
+        return np.minimum(bounds, np.log2(total)) + BOUND_SLACK
 
     def get_best_guess(self):
         # Determine optimal guess using entropy maximization
-        best_word = None
-        best_score = -float('inf')
+        if not len(self.possible_idx):
+            return None
         
+        # The first turn always searches the full answer list, so reuse the cached opener
+        first_turn = len(self.possible_idx) == len(self.answers)
+        if first_turn and self.opener is not None:
+            print(f"\nUsing cached opening guess: {self.opener}")
+            return self.opener
+        
+        best_word = self.search_best_guess()
+        if first_turn:
+            self.save_opener(best_word)
+        return best_word
+
+    def search_best_guess(self):
+        # Score candidates against the remaining answers and return the best word
         print("\nCalculating best initial guess...")
-        # Use first 2315 words (standard Wordle answer list size)
-        candidates = self.allowed[:2315]
-        for word in tqdm(candidates, desc="Analyzing words"):
-            score = self.calculate_entropy(word)
-            if score > best_score:
-                best_score = score
-                best_word = word
-                tqdm.write(f"Current best: {word} ({score:.2f})")  
+        start = time.perf_counter()
+        
+        # Entropy terms depend only on bucket sizes, so tabulate them once per call
+        table = entropy_table(len(self.possible_idx))
+        
+        # Score all candidates at once on the GPU while many answers remain,
+        # otherwise with the compiled kernel when Numba is available
+        scores = None
+        if cp is not None and len(self.possible_idx) > GPU_MIN_POSSIBLE:
+            scores = self.gpu_entropies(table)
+        elif njit is not None:
+            scores = best_entropy(self.PAT, np.arange(len(self.candidates)), self.possible_idx, table)
+        
+        if scores is not None:
+            best_index = int(np.flatnonzero(scores >= scores.max() - TIE_TOLERANCE)[0])
+            best_score = scores[best_index]
+            evaluated = len(scores)
+        else:
+            # Branch and bound: visit candidates by decreasing upper bound and stop once
+            # no remaining candidate can beat the best score (ties keep the earlier word)
+            bounds = self.entropy_upper_bounds()
+            order = np.argsort(-bounds, kind='stable')
+            bounds = bounds[order]
+            
+            if self.pool is not None:
+                # Deal the ordered candidates round-robin to workers, then keep the overall best
+                futures = [
+                    self.pool.submit(score_candidates, self.possible_idx, order[k::self.workers],
+                                     bounds[k::self.workers], table)
+                    for k in range(self.workers)
+                ]
+                results = [f.result() for f in futures]
+                best_index, best_score = None, -float('inf')
+                for index, score, _ in results:
+                    if index is not None and beats(score, index, best_score, best_index):
+                        best_index, best_score = index, score
+                evaluated = sum(r[2] for r in results)
+            else:
+                best_index, best_score, evaluated = None, -float('inf'), 0
+                for i, bound in zip(order, bounds):
+                    if bound < best_score - TIE_TOLERANCE:
+                        break
+                    score = self.calculate_entropy(i, table)
+                    evaluated += 1
+                    if beats(score, i, best_score, best_index):
+                        best_index, best_score = int(i), score
         
+        best_word = self.candidates[best_index]
+        print(f"Best: {best_word} ({best_score:.2f}) - evaluated {evaluated} of {len(self.candidates)} "
+              f"candidates in {time.perf_counter() - start:.3f}s")
         return best_word
 
-    def update_state(self, guess, feedback):
-        # Update game state based on feedback
-        new_possible = []
+    def load_pattern_table(self):
+        # Map the cached pattern table read-only, or compute it and try to cache it
+        shape = (len(self.candidates), len(self.answers))
+        if os.path.isfile(self.pat_path) and os.path.getsize(self.pat_path) == shape[0] * shape[1]:
+            PAT = np.memmap(self.pat_path, dtype=np.uint8, mode='r', shape=shape)
+            if self.pattern_table_matches(PAT):
+                return PAT
+        
+        PAT = np.empty(shape, dtype=np.uint8)
+        for i, guess in enumerate(self.candidate_codes):
+            PAT[i] = self.get_patterns(guess, self.answer_codes)
         
-        # Process feedback to update constraints
+        # Write to a temporary file first so readers never map a partial table
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{self.pat_path}.{os.getpid()}.tmp"
+            PAT.tofile(tmp_path)
+            os.replace(tmp_path, self.pat_path)
+        except OSError:
+            return PAT
+        return np.memmap(self.pat_path, dtype=np.uint8, mode='r', shape=shape)
+
+    def pattern_table_matches(self, PAT, samples=256):
+        # Spot-check a cached table against the scalar reference get_pattern
+        rng = np.random.default_rng(0)
+        rows = rng.integers(PAT.shape[0], size=samples)
+        cols = rng.integers(PAT.shape[1], size=samples)
+        return all(PAT[i, j] == self.get_pattern(self.candidates[i], self.answers[j]) for i, j in zip(rows, cols))
+
+    def load_opener(self):
+        # Read the cached opening guess for this word list, if any
+        try:
+            with open(self.opener_path, 'r') as f:
+                word = f.read().strip()
+        except OSError:
+            return None
+        return word if word in self.candidate_index else None
+
+    def save_opener(self, word):
+        # Cache the opening guess; a read-only cache directory only costs a recomputation
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self.opener_path, 'w') as f:
+                f.write(word)
+        except OSError:
+            return
+        self.opener = word
+
+    def close(self):
+        # Shut down worker processes
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def update_state(self, guess, feedback):
+        # Update game state based on feedback: first the constraint masks
         for i, (letter, color) in enumerate(feedback):
+            bit = 1 << (ord(letter) - 65)
             if color == 'C':
-                self.state['correct'][i] = letter
-                if letter in self.state['present']:
-                    self.state['present'].remove(letter)
+                self.correct_bytes[i] = ord(letter)
+                self.required_mask |= bit
             elif color == 'P':
-                self.state['present'].add(letter)
+                self.required_mask |= bit
+                self.pos_forbidden[i] |= bit
             elif color == 'A':
-                self.state['absent'].add(letter)
+                self.absent_mask |= bit
+                self.pos_forbidden[i] |= bit
         
         self.clean_constraints()
         
-        # Filter possible words using updated constraints
-        for word in self.state['possible']:
-            if self.is_word_valid(word):
-                new_possible.append(word)
-        
-        self.state['possible'] = new_possible
+        # Filter possible words: exact pattern match for table candidates, constraints otherwise
+        possible = self.possible_idx
+        if guess in self.candidate_index:
+            pid = self.pattern_id(color for _, color in feedback)
+            self.possible_idx = possible[self.PAT[self.candidate_index[guess], possible] == pid]
+        else:
+            self.possible_idx = possible[self.is_word_valid(possible)]
 
-    def is_word_valid(self, word):
-        # Check if word matches all current constraints
-        # Verify correct positions
-        for i, c in enumerate(self.state['correct']):
-            if c != '?' and word[i] != c:
-                return False
+    def is_word_valid(self, indices):
+        # Check which of the given answers match all current constraints (vectorized)
+        bits = self.word_bits[indices]
+        pos_bits = self.word_pos_bits[indices]
         
-        # Check required present letters
-        if any(p not in word for p in self.state['present']):
-            return False
+        # Check required letters and excluded letters
+        required = np.uint32(self.required_mask)
+        valid = ((bits & required) == required) & ((bits & np.uint32(self.absent_mask)) == 0)
         
-        # Check excluded letters
-        if any(a in word for a in self.state['absent'] 
-               if a not in self.state['correct'] and a not in self.state['present']):
-            return False
+        # Verify correct positions by comparing bytes at the known positions
+        correct = np.frombuffer(self.correct_bytes, dtype=np.uint8)
+        known = correct != ord('?')
+        valid &= (self.answer_bytes[indices][:, known] == correct[known]).all(axis=1)
         
-        # Prevent present letters in known incorrect positions
-        for i, letter in enumerate(word):
-            if letter in self.state['present'] and letter == self.state['correct'][i]:
-                return False
+        # Check letters ruled out per position
+        pos_forbidden = np.array(self.pos_forbidden, dtype=np.uint32)
+        valid &= ((pos_bits & pos_forbidden) == 0).all(axis=1)
         
-        return True
+        return valid
 
     def clean_constraints(self):
-        # Remove redundant constraints
-        self.state['present'] = {p for p in self.state['present'] if p not in self.state['correct']}
-        self.state['absent'] = {a for a in self.state['absent'] 
-                                if a not in self.state['correct'] and a not in self.state['present']}
+        # Remove redundant constraints: a repeated letter marked absent may still be required
+        self.absent_mask &= ~self.required_mask
 
     def print_status(self):
         # Display current game state
         print("\nCurrent Game Status:")
-        status = f"Possible words: {len(self.state['possible']):4}"
-        if len(self.state['possible']) <= 3:
-            status += f" ({', '.join(self.state['possible'])})"
+        status = f"Possible words: {len(self.possible_idx):4}"
+        if len(self.possible_idx) <= 3:
+            status += f" ({', '.join(self.answers[i] for i in self.possible_idx)})"
         print(status)
 
 def get_feedback_input(guess):
@@ -210,8 +572,8 @@ def main():
         solver.update_state(best_guess, feedback)
         
         # Check for win condition
-        if len(solver.state['possible']) == 1:
-            print(f"\nCONGRATULATIONS! THE WORD IS {solver.state['possible'][0]}!")
+        if len(solver.possible_idx) == 1:
+            print(f"\nCONGRATULATIONS! THE WORD IS {solver.answers[solver.possible_idx[0]]}!")
             break
 
 if __name__ == "__main__":